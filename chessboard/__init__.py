@@ -1,14 +1,52 @@
+import functools
 import os
-import io
-
-is_raspberrypi = False
-if os.name != 'posix':
-    is_raspberrypi = False
-try:
-    with io.open('/proc/cpuinfo', 'r') as cpuinfo:
-        for line in cpuinfo:
-            if line.startswith('Model') and 'Raspberry Pi' in line:
-                is_raspberrypi = True
-
-except Exception:
-    is_raspberrypi = False
+import sys
+from pathlib import Path
+
+_CPUINFO = '/proc/cpuinfo'
+_CACHE_FILE = 'cache/is_raspberrypi'
+
+
+def _probe_raspberrypi() -> bool:
+    """ Check /proc/cpuinfo for a Raspberry Pi model string. """
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        # procfs files can't be mmapped, read them in one go and search the raw bytes instead
+        return b'Raspberry Pi' in Path(_CPUINFO).read_bytes()
+    except OSError:
+        return False
+
+
+@functools.cache
+def is_raspberrypi() -> bool:
+    """ Check if running on a Raspberry Pi.
+
+    The probe runs on first call only and its result is cached in persistent storage, it is only redone when
+    the cache is missing or older than /proc/cpuinfo.
+    """
+    import chessboard.persistent_storage as persistent_storage
+
+    try:
+        cache_file = persistent_storage.get_filename(_CACHE_FILE)
+    except OSError:
+        return _probe_raspberrypi()
+
+    try:
+        if os.path.getmtime(cache_file) >= os.path.getmtime(_CPUINFO):
+            with open(cache_file, 'r') as f:
+                cached = f.read().strip()
+            if cached in ('0', '1'):
+                return cached == '1'
+    except OSError:
+        pass
+
+    result = _probe_raspberrypi()
+
+    try:
+        with open(cache_file, 'w') as f:
+            f.write('1' if result else '0')
+    except OSError:
+        pass
+
+    return result
@@ -3,14 +3,20 @@
 
 import argparse
 import logging
-import chess
 
 from chessboard.logger import log
 from chessboard import is_raspberrypi
 import chessboard.persistent_storage as persistent_storage
 
-if is_raspberrypi:
-    import chessboard.raspberry_pi_system
+
+def _chess_color(value: str) -> bool:
+    """ Parse a color argument, chess is imported here so --help doesn't have to load it. """
+    import chess
+
+    color = {'white': chess.WHITE, 'black': chess.BLACK}.get(value.lower())
+    if color is None:
+        raise argparse.ArgumentTypeError(f"invalid color '{value}', expected 'white' or 'black'")
+    return color
 
 
 def main():
@@ -18,7 +24,7 @@ def main():
     parser.add_argument('--new-game', action='store_true', help='Start a new game instead of loading the old one')
     parser.add_argument('--engine-weight', type=str, default=None,
                         help='Engine weight file to use for the engine (if applicable)')
-    parser.add_argument('--engine-color', type=chess.Color, default=None,
+    parser.add_argument('--engine-color', type=_chess_color, default=None,
                         help='Engine color to use for the engine (if applicable)')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--port', type=int, default=5000, help='Port to run the web server on')
@@ -34,7 +40,11 @@ def main():
         persistent_storage.set_persistent_storage_dir(args.persistent_storage_dir)
         log.info(f"Persistent storage directory set to: {args.persistent_storage_dir}")
 
-    # Initialize system by importing necessary modules
+    # Initialize system by importing necessary modules, deferred until after argument parsing so
+    # --help returns immediately and the persistent storage directory is set before settings load
+    if is_raspberrypi():
+        import chessboard.raspberry_pi_system
+
     from chessboard.game.game_state import game_state
     import chessboard.events as events
     import chessboard.api.api as api
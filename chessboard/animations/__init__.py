@@ -4,7 +4,6 @@ from chessboard.animations.water_droplet import AnimationWaterDroplet
 from chessboard.animations.rainbow import AnimationRainbow
 from chessboard.animations.pulse import AnimationPulse
 import chessboard.events as events
-from chessboard.game.game_state import game_state
 from chessboard.settings import settings, ColorSetting
 
 settings.register('animation.check.color', ColorSetting((255, 100, 255)), 'Color for when the king is in check')
@@ -34,12 +33,16 @@ _hint_animation = AnimationPulse(
     fps=10.0,
 )
 
+_subscriptions = events.SubscriptionTable()
 
+
+@_subscriptions.on(events.ChessMoveEvent)
 def _handle_chess_move_event(event: events.ChessMoveEvent) -> None:
     global _change_side_animation
     _change_side_animation.set_side(not event.side)
 
 
+@_subscriptions.on(events.LegalMoveDetectedEvent)
 def _handle_legal_move_detected(event: events.LegalMoveDetectedEvent) -> None:
     if not settings['animation.legal_move.enabled']:
         return
@@ -54,14 +57,15 @@ def _handle_legal_move_detected(event: events.LegalMoveDetectedEvent) -> None:
 _rainbow_animation_shown = False
 
 
+@_subscriptions.on(events.GameStateChangedEvent)
 def _handle_game_state_change(event: events.GameStateChangedEvent) -> None:
-    checkers = game_state.board.checkers()
-    king_square = game_state.board.king(game_state.board.turn)
+    checkers = event.checkers
+    king_square = event.king_square
 
     _hint_animation.stop()
 
     if checkers and king_square is not None:
-        _checkers_animation.squares = list(checkers) + [king_square]
+        _checkers_animation.squares = checkers + [king_square]
         if not _checkers_animation.is_running:
             _checkers_animation.start()
     else:
@@ -82,12 +86,14 @@ def _handle_game_state_change(event: events.GameStateChangedEvent) -> None:
         _rainbow_animation_shown = False
 
 
+@_subscriptions.on(events.HintEvent)
 def _handle_hint_event(event: events.HintEvent) -> None:
     _hint_animation.squares = [event.move.from_square, event.move.to_square]
     if not _hint_animation.is_running:
         _hint_animation.start()
 
 
+@_subscriptions.on(events.SquarePieceStateChangeEvent)
 def _handle_square_piece_state_change(event: events.SquarePieceStateChangeEvent) -> None:
     # Stop hint animation if either square involved changes piece state
     if _hint_animation.is_running:
@@ -96,8 +102,4 @@ def _handle_square_piece_state_change(event: events.SquarePieceStateChangeEvent)
                 _hint_animation.stop()
 
 
-events.event_manager.subscribe(events.ChessMoveEvent, _handle_chess_move_event)
-events.event_manager.subscribe(events.LegalMoveDetectedEvent, _handle_legal_move_detected)
-events.event_manager.subscribe(events.GameStateChangedEvent, _handle_game_state_change)
-events.event_manager.subscribe(events.HintEvent, _handle_hint_event)
-events.event_manager.subscribe(events.SquarePieceStateChangeEvent, _handle_square_piece_state_change)
+events.event_manager.register_all(_subscriptions)
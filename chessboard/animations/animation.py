@@ -2,9 +2,9 @@
 import threading
 import chessboard.events as events
 from chessboard.logger import log
-from time import time
-from chessboard.thread_safe_variable import ThreadSafeVariable
+from time import monotonic
 import chessboard.board.led_manager as leds
+from chessboard.animations.scheduler import scheduler
 
 
 class Animation:
@@ -13,28 +13,31 @@ class Animation:
                  priority: int = 10,
                  loop: bool = False):
 
-        self._thread = None
-
         if fps <= 0:
             raise ValueError("FPS must be greater than 0")
 
-        self._stop = threading.Event()
         self._loop = loop
-        self._frame_index = ThreadSafeVariable(0)
+        # Only written by the scheduler thread and under the frame lock, reading a plain int is atomic
+        self._frame_index = 0
 
         self._fps = fps
+        self._frame_time = 1.0 / fps
 
         self._led_layer = leds.LedLayer(priority=priority)
 
         self.start_time = 0.0
         self.frame_start_time = 0.0
 
-    def __del__(self) -> None:
-        self._stop.set()
+        # Frames are rendered by the shared scheduler thread, the lock keeps stop() from returning mid frame
+        self._frame_lock = threading.Lock()
+        self._started = False
+        self._running = False
+        # Incremented on every start so frames scheduled before a restart are discarded
+        self._generation = 0
 
     @property
     def frame_index(self) -> int:
-        return self._frame_index.get()
+        return self._frame_index
 
     @property
     def elapsed_time(self) -> float:
@@ -42,32 +45,35 @@ class Animation:
 
     @property
     def is_running(self) -> bool:
-        return self._thread is not None and self._thread.is_alive()
+        return self._running
 
     def update(self) -> bool:
         """ Update the animation state. Shall return True if the animation is complete. """
         raise NotImplementedError()
 
     def start(self):
-        if self._thread is not None:
+        if self._started:
             raise RuntimeError("Animation is already running")
 
-        self._stop.clear()
-
         leds.led_manager.add_layer(self._led_layer)
 
-        self._thread = threading.Thread(target=self._animate_thread, daemon=False)
+        with self._frame_lock:
+            self._started = True
+            self._running = True
+            self._generation += 1
+            self._frame_index = 0
+            self.start_time = monotonic()
 
-        self._thread.start()
+        scheduler.schedule(self, self.start_time)
 
     def stop(self) -> None:
-        if self._thread is None:
+        if not self._started:
             return
-        self._stop.set()
-
-        self._thread.join()
 
-        self._thread = None
+        # Waits for a frame currently being rendered to finish
+        with self._frame_lock:
+            self._started = False
+            self._running = False
 
         leds.led_manager.remove_layer(self._led_layer)
 
@@ -75,37 +81,46 @@ class Animation:
         self.stop()
         self.start()
 
-    def _animate_thread(self) -> None:
-        index = self.frame_index
-        start_time = None
-        is_complete = False
-
-        frame_time = 1.0 / self._fps
-        self._frame_index.set(0)
-        self.start_time = time()
-
-        while not self._stop.is_set() and not is_complete:
-            if start_time is not None:
-                elapsed = time() - start_time
-                if elapsed < frame_time:
-                    self._stop.wait(frame_time - elapsed)
-                    if self._stop.is_set():
-                        break
-                elif elapsed > frame_time:
-                    log.warning(
-                        f"Animation frame took longer ({elapsed:.3f}s) than its duration ({frame_time:.3f}s)")
-
-            self.frame_start_time = time()
+    def _run_frame(self, generation: int) -> float | None:
+        """ Render the next frame, called from the scheduler thread.
+
+        generation: The generation the frame was scheduled for, stale frames from before a restart are skipped.
+        returns: Monotonic deadline of the following frame, or None if the animation is done.
+        """
+        with self._frame_lock:
+            if not self._running or generation != self._generation:
+                return None
+
+            index = self._frame_index
+            frame_time = self._frame_time
+
+            # Frames are timed from their scheduled deadline so elapsed_time is exactly index * frame_time
+            self.frame_start_time = self.start_time + index * frame_time
             is_complete = self.update()
-            self._led_layer.commit()
-            start_time = time()
+            # Skip compositing and publishing frames that are fully hidden behind opaque layers above this one.
+            # update() still runs as it decides when the animation completes and may carry state between frames.
+            # The completing frame is always committed, the layer keeps showing it once the layers above are gone.
+            if is_complete or leds.led_manager.is_layer_visible(self._led_layer):
+                # Published by the scheduler once all frames due at the same time have been rendered
+                self._led_layer.commit(flush=False)
             index += 1
-            self._frame_index.set(index)
+            self._frame_index = index
 
             if is_complete:
                 if not self._loop:
-                    break
-                self._frame_index.set(0)
-                self.start_time = time()
-                is_complete = False
-                index = 0
+                    self._running = False
+                    return None
+                # Continue the next loop from the next deadline
+                self.start_time += index * frame_time
+                self._frame_index = index = 0
+
+            next_deadline = self.start_time + index * frame_time
+            remaining = next_deadline - monotonic()
+            if remaining < 0:
+                log.warning(
+                    f"Animation frame took longer ({frame_time - remaining:.3f}s) than its duration ({frame_time:.3f}s)")
+                # Shift the schedule instead of rushing through the missed frames
+                self.start_time -= remaining
+                next_deadline -= remaining
+
+            return next_deadline
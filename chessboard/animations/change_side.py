@@ -1,6 +1,9 @@
 import chess
 from chessboard.animations.animation import Animation
 
+# Squares on each rank, indexed by rank
+_RANK_SQUARES = tuple(tuple(sq for sq in chess.SQUARES if chess.square_rank(sq) == rank) for rank in range(8))
+
 
 class AnimationChangeSide(Animation):
     def __init__(self, duration: float, new_side: chess.Color, *args, **kwargs) -> None:
@@ -32,11 +35,11 @@ class AnimationChangeSide(Animation):
 
         self._current_position = max(0.0, min(7.0, self._current_position))
 
-        for rank in range(8):
+        intensity = self._led_layer.intensity
+        for rank, squares in enumerate(_RANK_SQUARES):
             length_from_max = abs(rank - self._current_position)
             interpolation = intensity_max - (length_from_max * (intensity_max - intensity_min) / 7.0)
-            self._led_layer.intensity.update({sq: interpolation for sq in
-                                             [s for s in chess.SQUARES if chess.square_rank(s) == rank]})
+            intensity.update(dict.fromkeys(squares, interpolation))
 
         done = self._current_position <= 0.0 or self._current_position >= 7.0
         return done
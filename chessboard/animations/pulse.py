@@ -20,6 +20,8 @@ class AnimationPulse(Animation):
         self._frequency_hz = frequency_hz
         self._period = 1.0 / frequency_hz
         self._pulses = pulses
+        self._omega = 2.0 * math.pi * frequency_hz
+        self._end_time = self._period * pulses if pulses is not None else None
 
         for square in pulsating_squares:
             self._led_layer.colors[square] = self._color
@@ -35,11 +37,14 @@ class AnimationPulse(Animation):
             self._led_layer.colors[square] = self._color
 
     def update(self) -> bool:
-        amplitude = abs(- 0.5 * math.cos(2 * math.pi * self._frequency_hz * self.elapsed_time) + 0.5)
+        t = self.elapsed_time
+
+        # Already within [0, 1] as cosine is bounded
+        amplitude = 0.5 - 0.5 * math.cos(self._omega * t)
 
         self._led_layer.layer_opacity = amplitude
 
-        if self._pulses is None:
+        if self._end_time is None:
             return False  # Infinite pulses
 
-        return self.elapsed_time >= self._period * self._pulses
+        return t >= self._end_time
@@ -4,6 +4,28 @@ import random
 import colorsys
 from chessboard.animations.animation import Animation
 from chessboard.settings import settings
+from chessboard.board.led_manager import WHITE_SQUARES, BLACK_SQUARES
+
+_HUE_STEPS = 1024
+_TWO_PI = 2.0 * math.pi
+# Order in which update() produces the square colors, white squares first
+_FRAME_SQUARES = WHITE_SQUARES + BLACK_SQUARES
+
+
+def _hue_table(saturation: float) -> tuple[tuple[float, float, float], ...]:
+    """ RGB (0.0 - 255.0) at full value for evenly spaced hues of the given saturation.
+
+    hsv_to_rgb is linear in value, so the color at any value is the table entry scaled by it.
+    """
+    table = []
+    for i in range(_HUE_STEPS):
+        r, g, b = colorsys.hsv_to_rgb(i / _HUE_STEPS, saturation, 1.0)
+        table.append((r * 255, g * 255, b * 255))
+    return tuple(table)
+
+
+_WHITE_HUES = _hue_table(0.95)
+_BLACK_HUES = _hue_table(0.8)
 
 
 class AnimationRainbow(Animation):
@@ -38,8 +60,14 @@ class AnimationRainbow(Animation):
             self._black_color = (0, 0, 0)
 
         # Static noise offsets per square for shimmering (stable over time)
-        random.seed(42)
-        self._noise: dict[chess.Square, float] = {sq: random.uniform(-0.07, 0.07) for sq in chess.SQUARES}
+        rng = random.Random(42)
+        noise = [rng.uniform(-0.07, 0.07) for _ in chess.SQUARES]
+
+        # Per-square (position along the flow axis, same position as an angle, noise) constant over all frames
+        self._white_params = tuple((self._pos_value(sq), _TWO_PI * self._pos_value(sq), noise[sq])
+                                   for sq in WHITE_SQUARES)
+        self._black_params = tuple((self._pos_value(sq), _TWO_PI * self._pos_value(sq), max(-0.02, noise[sq]))
+                                   for sq in BLACK_SQUARES)
 
     def _pos_value(self, sq: chess.Square) -> float:
         r = chess.square_rank(sq)
@@ -54,35 +82,34 @@ class AnimationRainbow(Animation):
     def update(self) -> bool:
         t = self.elapsed_time
         phase = (t * (1.0 + self._speed)) % 1.0
-
-        white_squares = [sq for sq in chess.SQUARES if (chess.square_rank(sq) + chess.square_file(sq)) % 2 == 1]
-        black_squares = [sq for sq in chess.SQUARES if (chess.square_rank(sq) + chess.square_file(sq)) % 2 == 0]
+        sin = math.sin
 
         # White squares: vivid rainbow with shimmer
-        for sq in white_squares:
-            pos = self._pos_value(sq)
+        hues = _WHITE_HUES
+        pulse_phase = _TWO_PI * t * 3.0
+        colors = []
+        for pos, pos_angle, noise in self._white_params:
             hue = (phase + pos) % 1.0
             # Slight brightness pulse + per-square noise
-            pulse = 0.15 * (0.5 + 0.5 * math.sin(2 * math.pi * (t * 3.0 + pos)))
-            val = min(1.0, 0.85 + pulse + self._noise[sq])
-            sat = min(1.0, 0.95)
-            r, g, b = colorsys.hsv_to_rgb(hue, sat, max(0.0, val))
-            self._led_layer.colors[sq] = (int(r * 255), int(g * 255), int(b * 255))
+            pulse = 0.15 * (0.5 + 0.5 * sin(pulse_phase + pos_angle))
+            val = max(0.0, min(1.0, 0.85 + pulse + noise))
+            r, g, b = hues[int(hue * _HUE_STEPS) % _HUE_STEPS]
+            colors.append((int(r * val), int(g * val), int(b * val)))
 
         # Black squares: keep mostly dark with gentle colored glints for contrast
-        for sq in black_squares:
-            pos = self._pos_value(sq)
+        hues = _BLACK_HUES
+        pulse_phase = _TWO_PI * t * 2.0
+        # Blend toward configured black for a subtle effect
+        br, bg, bb = (c * 0.7 for c in self._black_color)
+        for pos, pos_angle, noise in self._black_params:
             hue = (phase + pos) % 1.0
-            pulse = 0.08 * (0.5 + 0.5 * math.sin(2 * math.pi * (t * 2.0 + pos)))
-            val = min(0.25, 0.10 + pulse + max(-0.02, self._noise[sq]))
-            sat = 0.8
-            r, g, b = colorsys.hsv_to_rgb(hue, sat, max(0.0, val))
-            # Blend toward configured black for a subtle effect
-            br, bg, bb = self._black_color
-            self._led_layer.colors[sq] = (
-                min(255, int(br * 0.7 + r * 255 * 0.3)),
-                min(255, int(bg * 0.7 + g * 255 * 0.3)),
-                min(255, int(bb * 0.7 + b * 255 * 0.3)),
-            )
-
-        return self.elapsed_time >= self._duration
+            pulse = 0.08 * (0.5 + 0.5 * sin(pulse_phase + pos_angle))
+            # Scaled by the 0.3 blend weight of the rainbow color
+            val = max(0.0, min(0.25, 0.10 + pulse + noise)) * 0.3
+            r, g, b = hues[int(hue * _HUE_STEPS) % _HUE_STEPS]
+            colors.append((min(255, int(br + r * val)), min(255, int(bg + g * val)), min(255, int(bb + b * val))))
+
+        # The whole frame is written to the layer in one go
+        self._led_layer.assign_colors(_FRAME_SQUARES, colors)
+
+        return t >= self._duration
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from chessboard.logger import log
+import chessboard.board.led_manager as leds
+
+if TYPE_CHECKING:
+    from chessboard.animations.animation import Animation
+
+
+class _AnimationScheduler:
+    """ Runs the frames of all active animations from a single thread.
+
+    Animations are kept in a min-heap keyed by the deadline of their next frame, the thread sleeps until the
+    earliest deadline, renders that frame and reschedules the animation for its following frame.
+    """
+
+    def __init__(self) -> None:
+        # Entries are (deadline, sequence, generation, animation), the sequence number breaks deadline ties
+        self._queue: list[tuple[float, int, int, Animation]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, animation: Animation, deadline: float) -> None:
+        """ Schedule the next frame of an animation at the given monotonic deadline. """
+        with self._condition:
+            heapq.heappush(self._queue, (deadline, next(self._sequence), animation._generation, animation))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._main, name='AnimationScheduler', daemon=True)
+                self._thread.start()
+
+            self._condition.notify()
+
+    def _pop_due(self) -> list[tuple[int, Animation]]:
+        """ Wait for and pop all entries that are due. Stale entries of stopped or restarted animations are dropped. """
+        with self._condition:
+            due: list[tuple[int, Animation]] = []
+            while True:
+                if not self._queue:
+                    if due:
+                        return due
+                    self._condition.wait()
+                    continue
+
+                deadline, _, generation, animation = self._queue[0]
+                if not animation.is_running or animation._generation != generation:
+                    heapq.heappop(self._queue)
+                    continue
+
+                remaining = deadline - monotonic()
+                if remaining > 0:
+                    if due:
+                        return due
+                    # Woken early if an animation with an earlier deadline is scheduled meanwhile
+                    self._condition.wait(remaining)
+                    continue
+
+                heapq.heappop(self._queue)
+                due.append((generation, animation))
+
+    def _main(self) -> None:
+        while True:
+            for generation, animation in self._pop_due():
+                try:
+                    next_deadline = animation._run_frame(generation)
+                except Exception:
+                    log.exception(f"Error rendering frame of {type(animation).__name__}, stopping it")
+                    animation._running = False
+                    continue
+
+                if next_deadline is not None:
+                    self.schedule(animation, next_deadline)
+
+            # One composited frame for all animations rendered in this pass
+            leds.led_manager.flush()
+
+
+scheduler = _AnimationScheduler()
@@ -1,19 +1,35 @@
+import bisect
 import chess
+import itertools
 import math
 
 from chessboard.animations.animation import Animation
 
+# Euclidean distance between every pair of squares, indexed [from_square][to_square]
+_DISTANCES = tuple(
+    tuple(math.hypot(chess.square_rank(a) - chess.square_rank(b), chess.square_file(a) - chess.square_file(b))
+          for b in chess.SQUARES)
+    for a in chess.SQUARES)
+
+
+def _ripple_amplitudes(distances: tuple[float, ...], radius: float, inv_two_sigma_sq: float, damping: float,
+                       scale: float = 1.0) -> list[float]:
+    """ Amplitude (0.0 - scale) of a Gaussian ring of the given radius at each distance. """
+    exp = math.exp
+    return [min(1.0, max(0.0, exp(-((dist - radius)**2) * inv_two_sigma_sq) * damping)) * scale
+            for dist in distances]
+
 
 class AnimationWaterDroplet(Animation):
     def __init__(self,
-                 color: tuple[int, int, int],
                  center_square: chess.Square,
+                 color: tuple[int, int, int] = (150, 150, 150),
                  *args,
                  **kwargs) -> None:
         """ Water droplet ripple animation originating from a center square.
 
-        color: RGB color tuple for the droplet ripple.
         center_square: chess.Square where the droplet originates.
+        color: RGB color tuple for the droplet ripple.
         """
         super().__init__(*args, **kwargs)
 
@@ -25,30 +41,43 @@ class AnimationWaterDroplet(Animation):
         corners = [(0, 0), (0, 7), (7, 0), (7, 7)]
         self._max_radius = max(math.sqrt((r0 - r)**2 + (f0 - f)**2) for r, f in corners)
 
-        for sq in chess.SQUARES:
-            self._led_layer.colors[sq] = color
+        # Squares ordered by their distance from the center, so the squares near the wavefront form a slice
+        distances = _DISTANCES[self._center]
+        self._squares = tuple(sorted(chess.SQUARES, key=distances.__getitem__))
+        self._distances = tuple(distances[sq] for sq in self._squares)
+        # Slice of self._squares covered by the ring in the previous frame
+        self._window = (0, 0)
+
+        self._led_layer.assign_colors(chess.SQUARES, [color] * len(chess.SQUARES))
+        self._led_layer.assign_square_opacity(chess.SQUARES, [0.0] * len(chess.SQUARES))
 
         # Wave parameters: narrow ring (sigma) and damping
         self._sigma = 0.75  # ring thickness
         self._damp = 0.12   # damping factor
         self._boost = 1.0   # overall brightness boost at wavefront
 
+        self._inv_two_sigma_sq = 1.0 / (2 * self._sigma**2)
+        # The ring is negligible further than 3 sigma from the wavefront
+        self._reach = 3 * self._sigma
+
     def update(self) -> bool:
         radius = self.elapsed_time * self._max_radius
 
-        r0 = chess.square_rank(self._center)
-        f0 = chess.square_file(self._center)
+        # Damping with distance to emulate energy loss in water, equal for all squares in a frame
+        damping = math.exp(-self._damp * radius) * self._boost
+
+        # Only squares within reach of the wavefront are lit, clear the ones the ring has moved away from
+        start = bisect.bisect_left(self._distances, radius - self._reach)
+        end = bisect.bisect_right(self._distances, radius + self._reach)
+        previous_start, previous_end = self._window
+        self._led_layer.assign_square_opacity(self._squares[previous_start:previous_end],
+                                              itertools.repeat(0.0))
+        self._window = (start, end)
+
+        # Gaussian window around the wavefront radius for a thin ring, scaled down to a subtle opacity
+        opacities = _ripple_amplitudes(self._distances[start:end], radius, self._inv_two_sigma_sq, damping,
+                                       scale=0.2)
 
-        for sq in chess.SQUARES:
-            r = chess.square_rank(sq)
-            f = chess.square_file(sq)
-            dist = math.sqrt((r - r0)**2 + (f - f0)**2)
-            # Gaussian window around the wavefront radius for a thin ring
-            gauss = math.exp(-((dist - radius)**2) / (2 * self._sigma**2))
-            # Damping with distance to emulate energy loss in water
-            amplitude = gauss * math.exp(-self._damp * radius) * self._boost
-            amplitude = min(1.0, max(0.0, amplitude)) * 0.2
-
-            self._led_layer.square_opacity[sq] = amplitude
+        self._led_layer.assign_square_opacity(self._squares[start:end], opacities)
 
         return radius >= self._max_radius
@@ -1,3 +1,4 @@
+import functools
 import os
 from typing import Any
 from flask import Flask, render_template, send_from_directory, request, Response, url_for
@@ -16,9 +17,13 @@ from chessboard import is_raspberrypi
 from chessboard.game.game_state import game_state
 
 from chessboard.logger import log
-import traceback
 
 app = Flask(__name__, template_folder='templates', static_url_path='/static')
+# Emit UTF-8 directly instead of escaping every non-ASCII character, i.e. the unicode chess pieces
+app.json.ensure_ascii = False  # type: ignore
+# Key order doesn't matter to any client, skip sorting every response dict
+app.json.sort_keys = False  # type: ignore
+_STATIC_DIR = os.path.join(app.root_path, 'static')
 app.register_blueprint(api_board_wifi, url_prefix='/api/system/wifi', name='wifi')
 app.register_blueprint(api_board_system, url_prefix='/api/system', name='system')
 app.register_blueprint(api_board, url_prefix='/api/board', name='board')
@@ -38,9 +43,9 @@ def has_no_empty_params(rule):
     return len(defaults) >= len(arguments)
 
 
-@app.route('/')
-def index() -> str:
-    # Provide routes so index.html can render links to all pages
+@functools.cache
+def _index_links() -> tuple[str, ...]:
+    """ Links to all pages, the routes don't change once the app is set up so they are collected once. """
     links = []
     for rule in app.url_map.iter_rules():
         # Filter out rules we can't navigate to in a browser
@@ -50,7 +55,13 @@ def index() -> str:
             url = url_for(rule.endpoint, **(rule.defaults or {}))
             links.append(url)
 
-    return render_template('index.html', pages=links)
+    return tuple(links)
+
+
+@app.route('/')
+def index() -> str:
+    # Provide routes so index.html can render links to all pages
+    return render_template('index.html', pages=_index_links())
 
 
 @app.route('/display/240x320')
@@ -66,8 +77,8 @@ def install_weight() -> str:
 
 @app.route('/favicon.ico')
 def favicon() -> Response:
-    return send_from_directory(os.path.join(app.root_path, 'static'),
-                               'favicon.ico', mimetype='image/vnd.microsoft.icon')
+    # The icon only changes with a new release, let browsers keep it for a day
+    return send_from_directory(_STATIC_DIR, 'favicon.ico', mimetype='image/vnd.microsoft.icon', max_age=86400)
 
 
 @app.route('/overview')
@@ -100,15 +111,18 @@ def handle_publish_event(data: dict[str, Any]) -> None:
         log.error("publish_event missing 'event_type'")
         return
 
+    event_class = chessboard.events.resolve(event_type)
+    if event_class is None:
+        log.error(f"publish_event unknown 'event_type': {event_type}")
+        return
+
     try:
-        event_class = getattr(chessboard.events, event_type)
-        log.debug(f"publish_event: {event_type}; {event_data}")
+        log.debug("publish_event: %s; %s", event_type, event_data)
 
         event_instance = event_class(**event_data)
         chessboard.events.event_manager.publish(event_instance)
     except Exception as e:
-        traceback_lines = "\n    ".join(traceback.format_exc().splitlines())
-        log.error(f"Error handling publish_event: {e}: \n    {traceback_lines}")
+        log.exception(f"Error handling publish_event: {e}")
         return
 
 
@@ -122,7 +136,7 @@ chessboard.events.event_manager.subscribe_all_events(lambda event: emit_event(ev
 
 
 def emit_event(event: chessboard.events.Event):
-    socketio.emit(f'board_event.{type(event).__name__}', event.to_json())
+    socketio.emit(event._topic, event.to_json())
 
 
 if __name__ == '__main__':
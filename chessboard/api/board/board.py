@@ -7,6 +7,12 @@ from chessboard.board.led_manager import led_manager, LedLayer
 api = Blueprint('api', __name__, template_folder='templates')
 
 _color_preview_layer = LedLayer(priority=100)
+# Squares lit by the color preview
+_PREVIEW_SQUARES = (chess.E4, chess.E5, chess.D4, chess.D5)
+
+# Unicode symbol for every (piece type, color), built once instead of a Piece object per occupied square
+_PIECE_SYMBOLS = tuple((piece_type, color, chess.Piece(piece_type, color).unicode_symbol())
+                       for piece_type in chess.PIECE_TYPES for color in chess.COLORS)
 
 
 @api.route('/square/colors', methods=['GET'])
@@ -25,14 +31,13 @@ def preview_square_color() -> Response | tuple[Response, int]:
     if color is None:
         return jsonify({'success': False, 'error': 'Missing color, use DELETE to clear preview'}), 400
 
-    if (not isinstance(color, list) or len(color) != 3 or
-            not all(isinstance(c, int) and 0 <= c <= 255 for c in color)):
+    if (type(color) is not list or len(color) != 3 or
+            not all(type(c) is int and 0 <= c <= 255 for c in color)):
         return jsonify({'success': False, 'error': 'Invalid color value'}), 400
 
+    preview_color = (color[0], color[1], color[2])
     _color_preview_layer.reset()
-    middle_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
-    for square in middle_squares:
-        _color_preview_layer.colors[square] = tuple(color)
+    _color_preview_layer.assign_colors(_PREVIEW_SQUARES, [preview_color] * len(_PREVIEW_SQUARES))
 
     if not led_manager.has_layer(_color_preview_layer):
         led_manager.add_layer(_color_preview_layer)
@@ -54,9 +59,11 @@ def clear_square_color_preview() -> Response:
 def get_board_state() -> Response:
     """API endpoint to get the current board state"""
 
+    board = game_state.board
     pieces = {}
-    for square, piece in game_state.board.piece_map().items():
-        pieces[square] = piece.unicode_symbol()
+    for piece_type, color, symbol in _PIECE_SYMBOLS:
+        for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+            pieces[square] = symbol
 
     return jsonify({'success': True, 'board_state': pieces})
 
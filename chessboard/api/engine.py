@@ -1,12 +1,16 @@
 import os
+import re
 from flask import Blueprint, jsonify, request
 import chessboard.game.engine as engine
 from werkzeug.utils import secure_filename
 from chessboard.logger import log
-import tempfile
 
 api = Blueprint('api', __name__, template_folder='templates')
 
+# Names of installed weights, installed names have already been through secure_filename() which doesn't limit the
+# length, so neither does this
+_WEIGHT_NAME_RE = re.compile(r'[A-Za-z0-9._-]+')
+
 
 @api.route('/weights', methods=['GET'])
 def get_available_weights():
@@ -17,11 +21,13 @@ def get_available_weights():
 
         for weight in available_weights:
             filename = engine.get_weight_filename(weight)
+            # One stat call for both size and modification time
+            stat = os.stat(filename)
             weights.append({
                 'name': weight,
-                'size': os.path.getsize(filename),
-                'last_modified': os.path.getmtime(filename),
-                'filename': engine.get_weight_filename(weight)
+                'size': stat.st_size,
+                'last_modified': stat.st_mtime,
+                'filename': filename
             })
 
         return jsonify({'success': True, 'weights': weights})
@@ -33,6 +39,9 @@ def get_available_weights():
 @api.route('/weights/<weight_name>', methods=['DELETE'])
 def delete_weight(weight_name):
     """API endpoint to delete an engine weight"""
+    if not _WEIGHT_NAME_RE.fullmatch(weight_name):
+        return jsonify({'success': False, 'error': 'Invalid weight name'}), 400
+
     try:
         weight_name = secure_filename(weight_name)
         engine.delete_weight(weight_name)
@@ -83,10 +92,7 @@ def install_weight():
 
         name = secure_filename(name)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_path = os.path.join(tmpdir, name)
-            uploaded.save(temp_path)
-            engine.install_weight(temp_path)
+        engine.install_weight_from_stream(uploaded.stream, name)
 
         return jsonify({'success': True, 'installed': name})
     except FileExistsError:
@@ -6,6 +6,13 @@ import chessboard.game.engine as engine
 
 api = Blueprint('api', __name__, template_folder='templates')
 
+_ENGINE_COLORS = {'white': chess.WHITE, 'black': chess.BLACK}
+
+
+def _is_non_negative_number(value: object) -> bool:
+    """ Check for an int or float of at least zero, JSON booleans are not numbers. """
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+
 
 @api.route('/bots', methods=['GET'])
 def get_available_bots():
@@ -28,11 +35,21 @@ def start_new_game():
     if not engine_color:
         engine_name = None
         engine_color = None
-    elif engine_color.lower() in ('white', 'black'):
-        engine_color = chess.WHITE if engine_color.lower() == 'white' else chess.BLACK
     else:
-        log.warning(f"Invalid engine color specified: {engine_color}")
-        return jsonify({'success': False, 'error': 'Invalid engine color specified'}), 400
+        color = _ENGINE_COLORS.get(engine_color.lower()) if isinstance(engine_color, str) else None
+        if color is None:
+            log.warning(f"Invalid engine color specified: {engine_color}")
+            return jsonify({'success': False, 'error': 'Invalid engine color specified'}), 400
+        engine_color = color
+
+    # Cheap checks of the request itself first, the opponent check below may have to download the weight file
+    if not _is_non_negative_number(start_time_seconds):
+        log.warning(f"Invalid start time specified: {start_time_seconds}")
+        return jsonify({'success': False, 'error': f'Invalid start time specified'}), 400
+
+    if not _is_non_negative_number(increment_seconds):
+        log.warning(f"Invalid increment specified: {increment_seconds}")
+        return jsonify({'success': False, 'error': 'Invalid increment specified'}), 400
 
     if engine_name and engine_name not in engine.get_available_weights():
         log.warning(f"Attempted to start game with unavailable opponent: '{engine_name}'")
@@ -41,14 +58,6 @@ def start_new_game():
         log.warning(f"Engine weight file for '{engine_name}' not found")
         return jsonify({'success': False, 'error': 'Selected opponent weight file not found'}), 400
 
-    if type(start_time_seconds) not in (float, int) or start_time_seconds < 0:
-        log.warning(f"Invalid start time specified: {start_time_seconds}")
-        return jsonify({'success': False, 'error': f'Invalid start time specified'}), 400
-
-    if type(increment_seconds) not in (float, int) or increment_seconds < 0:
-        log.warning(f"Invalid increment specified: {increment_seconds}")
-        return jsonify({'success': False, 'error': 'Invalid increment specified'}), 400
-
     if start_time_seconds == 0.0:
         start_time_seconds = float('inf')  # Represent unlimited time
 
@@ -94,22 +103,38 @@ def regret_last_move():
 @api.route('/state', methods=['GET'])
 def get_game_state():
     """API endpoint to get the current game state"""
+    board = game_state.board
+    clock = game_state.chess_clock
+
+    # A single outcome() check generates the legal moves once, instead of once per is_*() call
+    outcome = board.outcome()
+    termination = outcome.termination if outcome is not None else None
+    is_check = board.is_check()
+    is_insufficient_material = board.is_insufficient_material()
+    is_stalemate = termination == chess.Termination.STALEMATE
+    if termination == chess.Termination.INSUFFICIENT_MATERIAL and not is_check:
+        # outcome() reports insufficient material before stalemate, a position can be both
+        is_stalemate = not any(board.generate_legal_moves())
+
+    white_time_left = clock.white_time_left
+    black_time_left = clock.black_time_left
+
     return jsonify({
         'success': True,
-        'fen': game_state.board.fen(),
-        'turn': 'white' if game_state.board.turn == chess.WHITE else 'black',
-        'is_check': game_state.board.is_check(),
-        'is_checkmate': game_state.board.is_checkmate(),
-        'is_stalemate': game_state.board.is_stalemate(),
-        'is_insufficient_material': game_state.board.is_insufficient_material(),
-        'is_game_over': game_state.board.is_game_over(),
-        'last_move': game_state.board.move_stack[-1].uci() if game_state.board.move_stack else None,
+        'fen': game_state.fen(),
+        'turn': 'white' if board.turn == chess.WHITE else 'black',
+        'is_check': is_check,
+        'is_checkmate': termination == chess.Termination.CHECKMATE,
+        'is_stalemate': is_stalemate,
+        'is_insufficient_material': is_insufficient_material,
+        'is_game_over': outcome is not None,
+        'last_move': board.move_stack[-1].uci() if board.move_stack else None,
         'started': game_state.is_game_started,
         'paused': game_state.is_game_paused,
         'clocks': {
-            'white_time_left': game_state.chess_clock.white_time_left if game_state.chess_clock.white_time_left != float('inf') else None,
-            'black_time_left': game_state.chess_clock.black_time_left if game_state.chess_clock.black_time_left != float('inf') else None,
-            'paused': game_state.chess_clock.paused
+            'white_time_left': white_time_left if white_time_left != float('inf') else None,
+            'black_time_left': black_time_left if black_time_left != float('inf') else None,
+            'paused': clock.paused
         },
         'white_player': game_state._players[chess.WHITE],
         'black_player': game_state._players[chess.BLACK]
@@ -5,20 +5,32 @@ from chessboard.logger import log
 api = Blueprint('api', __name__, template_folder='templates')
 
 
+# Settings listing of GET / and the settings version it was built from
+_settings_listing: tuple[int, dict[str, dict]] | None = None
+
+
 @api.route('/')
 def settings():
     """API endpoint to get the settings page"""
-    _settings = {}
-    for key, setting in chessboard_settings.all_settings.items():
+    global _settings_listing
+
+    # Read the version before the values, a change while building only makes the next request rebuild
+    version = chessboard_settings.version
+    if _settings_listing is None or _settings_listing[0] != version:
+        _settings = {}
+        # Listed alphabetically, the settings menus show them in response order
+        for key, setting in sorted(chessboard_settings.all_settings.items()):
+
+            _settings[key] = {
+                'value': setting.value,
+                'default': setting.default,
+                'description': setting.description
+            }
 
-        _settings[key] = {
-            'value': setting.value,
-            'default': setting.default,
-            'description': setting.description
-        }
+        log.debug("Settings retrieved: %s", _settings)
+        _settings_listing = (version, _settings)
 
-    log.debug(f"Settings retrieved: {_settings}")
-    return jsonify(success=True, settings=_settings)
+    return jsonify(success=True, settings=_settings_listing[1])
 
 
 @api.route('/restore_defaults', methods=['POST'])
@@ -34,7 +46,7 @@ def get_setting(key):
     """API endpoint to get a specific setting"""
     try:
         setting = chessboard_settings.get(key)
-        log.debug(f"Setting '{key}' retrieved: {setting}")
+        log.debug("Setting '%s' retrieved: %s", key, setting)
         return jsonify(success=True, setting=setting.to_json())
     except KeyError:
         log.error(f"Setting '{key}' not found")
@@ -1,17 +1,34 @@
 import os
+import re
 from flask import Blueprint, jsonify, request
 import psutil
+import socket
+import subprocess
 import time
 import chessboard.events as events
+from chessboard.logger import log
 import threading
 api = Blueprint('api', __name__, template_folder='templates')
 
+# Constant while the process runs, read once instead of on every /info request
+_UNAME = os.uname()
+# Process start on the monotonic clock, uptimes must not follow wall clock steps such as the first NTP sync after boot
+_PROCESS_START = time.monotonic() - (time.time() - psutil.Process().create_time())
+
+_HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9-]{1,63}$')
+
+
+def _run_delayed(args: list[str], delay: float = 1.0) -> None:
+    """ Run a command in the background after a delay so the response is returned first. """
+    threading.Timer(delay, lambda: subprocess.Popen(
+        args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)).start()
+
 
 @api.route('/shutdown', methods=['POST'])
 def shutdown():
     """API endpoint to shut down the system"""
     events.event_manager.publish(events.SystemShutdownEvent(), block=True)
-    os.system('(sleep 1; shutdown -h now) >/dev/null 2>&1 &')
+    _run_delayed(['shutdown', '-h', 'now'])
     return jsonify({'success': True})
 
 
@@ -20,7 +37,7 @@ def reboot():
     """API endpoint to reboot the system"""
     # Schedule reboot in background after a short delay so the response is returned first
     events.event_manager.publish(events.SystemShutdownEvent(), block=True)
-    os.system('(sleep 1; reboot) >/dev/null 2>&1 &')
+    _run_delayed(['reboot'])
     return jsonify({'success': True})
 
 
@@ -32,18 +49,34 @@ def info():
     disk_usage = psutil.disk_usage('/')
     memory = psutil.virtual_memory()
 
+    # Sampled once, the average is derived from the per cpu values instead of sampling again
+    cpu_percent_percpu = psutil.cpu_percent(interval=None, percpu=True)
+    cpu_percent = sum(cpu_percent_percpu) / len(cpu_percent_percpu) if cpu_percent_percpu else 0.0
+
+    process = psutil.Process()
+    # oneshot() reads the shared /proc files of the process once for all values below
+    with process.oneshot():
+        process_info = {
+            'pid': process.pid,
+            'memory_info': process.memory_info()._asdict(),
+            'cpu_times': process.cpu_times()._asdict(),
+            'process_uptime': time.monotonic() - _PROCESS_START,
+            'num_threads': process.num_threads(),
+            'threads': [t._asdict() for t in process.threads()],
+        }
+
     return jsonify({
-        'kernel': f"{os.uname().sysname} {os.uname().release}",
-        'architecture': os.uname().machine,
-        'hostname': os.popen('hostname').read().strip(),
-        'system_uptime': time.time() - psutil.boot_time(),
+        'kernel': f"{_UNAME.sysname} {_UNAME.release}",
+        'architecture': _UNAME.machine,
+        'hostname': socket.gethostname(),
+        'system_uptime': time.clock_gettime(time.CLOCK_BOOTTIME),
         'load_average': {
             '1min': loadavg[0],
             '5min': loadavg[1],
             '15min': loadavg[2],
         },
-        'cpu_percent_percpu': psutil.cpu_percent(percpu=True),
-        'cpu_percent': psutil.cpu_percent(),
+        'cpu_percent_percpu': cpu_percent_percpu,
+        'cpu_percent': cpu_percent,
         'memory': {
             'total': memory.total,
             'used': memory.used,
@@ -59,14 +92,7 @@ def info():
             'free_%': 100 - disk_usage.percent
         },
         'threads': [{'name': t.name, 'id': t.ident} for t in threading.enumerate()],
-        'process': {
-            'pid': os.getpid(),
-            'memory_info': psutil.Process().memory_info()._asdict(),
-            'cpu_times': psutil.Process().cpu_times()._asdict(),
-            'process_uptime': time.time() - psutil.Process().create_time(),
-            'num_threads': psutil.Process().num_threads(),
-            'threads': [t._asdict() for t in psutil.Process().threads()],
-        },
+        'process': process_info,
     })
 
 
@@ -74,7 +100,7 @@ def info():
 def hostname():
     """API endpoint to get or set the system hostname"""
     if request.method == 'GET':
-        hostname = os.popen('hostname').read().strip()
+        hostname = socket.gethostname()
         return jsonify({'success': True, 'hostname': hostname})
 
     elif request.method == 'POST':
@@ -84,7 +110,20 @@ def hostname():
         if not new_hostname:
             return jsonify({'success': False, 'error': 'Hostname cannot be empty'}), 400
 
-        os.system(f'hostnamectl set-hostname {new_hostname}')
+        if not _HOSTNAME_RE.match(new_hostname):
+            return jsonify({'success': False, 'error': 'Hostname may only contain letters, digits and hyphens'}), 400
+
+        try:
+            result = subprocess.run(['hostnamectl', 'set-hostname', new_hostname],
+                                    capture_output=True, text=True, check=False)
+        except OSError as e:
+            log.error(f"Error setting hostname: {e}")
+            return jsonify({'success': False, 'error': 'Failed to set hostname'}), 500
+
+        if result.returncode != 0:
+            log.error(f"ERROR: hostnamectl output: {result.stdout}, error: {result.stderr}")
+            return jsonify({'success': False, 'error': 'Failed to set hostname'}), 500
+
         return jsonify({'success': True, 'hostname': new_hostname})
 
     return jsonify({'success': False, 'error': 'Invalid request method'}), 405
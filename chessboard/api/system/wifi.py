@@ -1,10 +1,65 @@
 from flask import Blueprint, jsonify, request, Response
+import fcntl
+import functools
+import socket
+import struct
 import subprocess
+import threading
+from time import monotonic
 from chessboard.logger import log
-from typing import Any, Optional
+from typing import Any, Callable, Generic, Optional, TypeVar
 
 api = Blueprint('api', __name__, template_folder='templates')
 
+_T = TypeVar('_T')
+
+# Seconds the result of the nmcli/ip helpers is reused, polling clients would otherwise spawn processes per request
+_CACHE_TTL = 3.0
+
+_PROC_NET_ROUTE = '/proc/net/route'
+_RTF_UP = 0x0001
+_SIOCGIFADDR = 0x8915
+
+
+class _TtlCache(Generic[_T]):
+    """ Cache the result of a function without arguments for ttl seconds. """
+
+    def __init__(self, func: Callable[[], _T], ttl: float) -> None:
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._cached: tuple[float, _T] | None = None
+        # Bumped by cache_clear() so a result computed before the clear is not stored
+        self._generation = 0
+
+    def __call__(self) -> _T:
+        with self._lock:
+            cached = self._cached
+            generation = self._generation
+
+        if cached is not None and monotonic() - cached[0] < self._ttl:
+            return cached[1]
+
+        # Called without holding the lock so a slow command doesn't hold up callers that hit the cache
+        value = self._func()
+        with self._lock:
+            if self._generation == generation:
+                self._cached = (monotonic(), value)
+        return value
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._cached = None
+
+
+def _ttl_cache(ttl: float) -> Callable[[Callable[[], _T]], _TtlCache[_T]]:
+    """ Decorator caching the result of a function without arguments for ttl seconds. """
+    def decorator(func: Callable[[], _T]) -> _TtlCache[_T]:
+        return _TtlCache(func, ttl)
+    return decorator
+
 
 @api.route('/info')
 def info() -> Response:
@@ -36,31 +91,8 @@ def connect() -> Response | tuple[Response, int]:
 @api.route('/scan')
 def scan() -> Response:
     """API endpoint to scan for available WiFi networks"""
-    networks: list[dict[str, str]] = []
-    try:
-        result = subprocess.run(
-            ['nmcli', '-t', '-f', 'SSID,SIGNAL,SECURITY', 'dev', 'wifi', 'list'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                parts = line.split(':')
-                if len(parts) >= 3:
-                    ssid = parts[0]
-                    signal = parts[1]
-                    security = parts[2]
-                    networks.append({
-                        'ssid': ssid,
-                        'signal': signal,
-                        'security': security
-                    })
-
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-        log.error(f"Error scanning WiFi networks: {e}")
+    networks = [{'ssid': ssid, 'signal': signal, 'security': security}
+                for _, ssid, signal, security in _list_wifi_networks()]
 
     return jsonify({'success': True, 'networks': networks})
 
@@ -77,6 +109,12 @@ def add_new_wifi_network(ssid: str, password: str) -> bool:
         )
         if result.returncode != 0:
             log.error(f"ERROR: nmcli output: {result.stdout}, error: {result.stderr}")
+        else:
+            # The connection state changed, don't serve it from cache
+            _list_wifi_networks.cache_clear()
+            get_wifi_info.cache_clear()
+            get_default_interface.cache_clear()
+            get_ip_address.cache_clear()
         return result.returncode == 0
 
     except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
@@ -84,96 +122,94 @@ def add_new_wifi_network(ssid: str, password: str) -> bool:
         return False
 
 
-def get_default_interface() -> str:
-    """Get the default gateway IP address"""
+@_ttl_cache(_CACHE_TTL)
+def _list_wifi_networks() -> list[tuple[str, str, str, str]]:
+    """List visible WiFi networks as (active, ssid, signal, security) using a single nmcli call"""
+    networks: list[tuple[str, str, str, str]] = []
     try:
         result = subprocess.run(
-            ['ip', 'route', 'show', 'default'],
+            ['nmcli', '-t', '-f', 'ACTIVE,SSID,SIGNAL,SECURITY', 'dev', 'wifi', 'list'],
             capture_output=True,
             text=True,
             timeout=5
         )
 
         if result.returncode == 0:
-            line = result.stdout.strip()
-            parts = line.split()
-            if 'dev' in parts:
-                dev_index = parts.index('dev')
-                if dev_index + 1 < len(parts):
-                    return parts[dev_index + 1]
-        else:
-            log.error(f"ERROR: ip command output: {result.stdout}, error: {result.stderr}")
+            lines = result.stdout.strip().split('\n')
+            for line in lines:
+                parts = line.split(':')
+                if len(parts) >= 4:
+                    networks.append((parts[0], parts[1], parts[2], parts[3]))
+
     except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
+        log.error(f"Error scanning WiFi networks: {e}")
+
+    return networks
+
+
+@_ttl_cache(_CACHE_TTL)
+def get_default_interface() -> str:
+    """Get the interface of the default route"""
+    try:
+        # Read the kernel routing table directly instead of spawning and parsing `ip route`
+        with open(_PROC_NET_ROUTE, 'r') as f:
+            next(f)  # Header
+            for line in f:
+                fields = line.split()
+                # Destination and mask 0.0.0.0 is the default route
+                if len(fields) >= 8 and fields[1] == '00000000' and fields[7] == '00000000' \
+                        and int(fields[3], 16) & _RTF_UP:
+                    return fields[0]
+    except (OSError, ValueError, StopIteration) as e:
         log.error(f"Error getting default interface: {e}")
 
     return 'N/A'
 
 
+@_ttl_cache(_CACHE_TTL)
 def get_ip_address() -> str:
     """Get the current IP address of the default interface interface"""
-    try:
-
-        result = subprocess.run(
-            ['ip', 'addr', 'show', get_default_interface()],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+    interface = get_default_interface()
+    if interface == 'N/A':
+        return 'N/A'
 
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('inet '):
-                    ip = line.split()[1].split('/')[0]
-                    return ip
-        else:
-            log.error(f"ERROR: ip command output: {result.stdout}, error: {result.stderr}")
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            ifreq = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, struct.pack('256s', interface[:15].encode()))
+        # struct ifreq is the 16 byte name followed by a sockaddr_in, the address is at offset 4 of it
+        return socket.inet_ntoa(ifreq[20:24])
+    except OSError as e:
         log.error(f"Error getting IP address: {e}")
 
     return 'N/A'
 
 
+@_ttl_cache(_CACHE_TTL)
 def get_wifi_info() -> dict[str, Any]:
     """Get current WiFi connection information"""
     try:
-        # Try using nmcli (NetworkManager command line)
-        result = subprocess.run(
-            ['nmcli', '-t', '-f', 'active,ssid,signal', 'dev', 'wifi'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if line.startswith('yes:'):
-                    parts = line.split(':')
-                    if len(parts) >= 3:
-                        ssid = parts[1]
-                        signal = parts[2] if len(parts) > 2 else '0'
-
-                        # Determine signal strength
-                        try:
-                            signal_int = int(signal)
-                            if signal_int >= 70:
-                                strength = 'Strong'
-                            elif signal_int >= 50:
-                                strength = 'Medium'
-                            else:
-                                strength = 'Weak'
-                        except ValueError:
-                            strength = 'Unknown'
-
-                        return {
-                            'connected': True,
-                            'ssid': ssid,
-                            'signal': f"{strength} ({signal}%)",
-                            'signal_strength': signal,
-                            'ip': get_ip_address()
-                        }
+        # Try using nmcli (NetworkManager command line), shares the scan of /scan
+        for active, ssid, signal, _ in _list_wifi_networks():
+            if active == 'yes':
+                # Determine signal strength
+                try:
+                    signal_int = int(signal)
+                    if signal_int >= 70:
+                        strength = 'Strong'
+                    elif signal_int >= 50:
+                        strength = 'Medium'
+                    else:
+                        strength = 'Weak'
+                except ValueError:
+                    strength = 'Unknown'
+
+                return {
+                    'connected': True,
+                    'ssid': ssid,
+                    'signal': f"{strength} ({signal}%)",
+                    'signal_strength': signal,
+                    'ip': get_ip_address()
+                }
 
         # If nmcli didn't work, try iwgetid
         result = subprocess.run(
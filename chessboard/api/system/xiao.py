@@ -1,5 +1,4 @@
 
-import os
 from flask import Blueprint, jsonify, request, render_template
 import tempfile
 from chessboard import is_raspberrypi
@@ -8,6 +7,8 @@ import shutil
 
 api = Blueprint('api', __name__, template_folder='templates')
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 @api.route('/update_firmware', methods=['POST'])
 def update_firmware():
@@ -22,12 +23,16 @@ def update_firmware():
             return jsonify({'success': False, 'error': 'No selected file'}), 400
 
         with tempfile.NamedTemporaryFile() as firmware:
-            file.save(firmware.name)
+            # Stream the upload into the open temp file in large chunks
+            shutil.copyfileobj(file.stream, firmware, length=_COPY_CHUNK_SIZE)
+            size = firmware.tell()
+            # Flashing reads the file by name
+            firmware.flush()
 
             log.info(
-                f"Firmware file '{file.filename}' uploaded successfully to {firmware.name} with size {os.path.getsize(firmware.name)} bytes")
+                f"Firmware file '{file.filename}' uploaded successfully to {firmware.name} with size {size} bytes")
 
-            if is_raspberrypi:
+            if is_raspberrypi():
                 from chessboard.raspberry_pi_system.xiao_interface import xiao_interface
                 xiao_interface.flash_firmware(firmware.name)
             else:
@@ -44,7 +49,7 @@ def update_firmware():
 def calibrate_sensors():
     """API endpoint to calibrate the Xiao sensors"""
     try:
-        if is_raspberrypi:
+        if is_raspberrypi():
             from chessboard.raspberry_pi_system.xiao_interface import xiao_interface
             xiao_interface.calibrate_sensors()
         else:
@@ -61,7 +66,7 @@ def get_xiao_info():
     """API endpoint to get the status of the Xiao microcontroller"""
     try:
         info = {}
-        if is_raspberrypi:
+        if is_raspberrypi():
             from chessboard.raspberry_pi_system.xiao_interface import xiao_interface
             info['version'] = xiao_interface.version
             info['port'] = xiao_interface.port.port
@@ -1,3 +1,6 @@
+import collections
+import logging
+
 import chess
 
 
@@ -30,11 +33,12 @@ class BoardState:
         events.event_manager.subscribe(events.TimeButtonPressedEvent, self._handle_time_button_pressed_event)
         events.event_manager.subscribe(events.GameStateChangedEvent, self._handle_game_state_change_event)
 
-        # Current realtime state of pieces on board
+        # Current realtime state of pieces on board, also kept as occupancy bitboards per color
         self._board_piece_color_map: list[chess.Color | None] = [None] * 64
-        for square in chess.SQUARES:
-            # Start of assuming board matches game state
-            self._board_piece_color_map[square] = game_state.board.color_at(square)
+        self._board_white_bb = chess.BB_EMPTY
+        self._board_black_bb = chess.BB_EMPTY
+        # Start of assuming board matches game state
+        self._set_board_piece_colors([game_state.board.color_at(square) for square in chess.SQUARES])
 
         self._led_layer = leds.LedLayer(priority=0)
         leds.led_manager.add_layer(self._led_layer)
@@ -48,11 +52,21 @@ class BoardState:
         self._scan_board(self._latest_board)
 
     def _handle_piece_state_change_event(self, event: events.SquarePieceStateChangeEvent):
-        self._board_piece_color_map = event.colors
+        self._set_board_piece_colors(event.colors)
         move = self._scan_board(self._latest_board)
         if move is not None and move.to_square in event.squares:
             events.event_manager.publish(events.LegalMoveDetectedEvent(move=move))
 
+    def _set_board_piece_colors(self, colors: list[chess.Color | None]) -> None:
+        self._board_piece_color_map = colors
+        self._board_white_bb = chess.BB_EMPTY
+        self._board_black_bb = chess.BB_EMPTY
+        for square, color in enumerate(colors):
+            if color == chess.WHITE:
+                self._board_white_bb |= chess.BB_SQUARES[square]
+            elif color == chess.BLACK:
+                self._board_black_bb |= chess.BB_SQUARES[square]
+
     def _handle_time_button_pressed_event(self, event: events.TimeButtonPressedEvent):
         if event.color != game_state.board.turn:
             log.warning(
@@ -73,8 +87,8 @@ class BoardState:
 
         if game_state.board.move_stack:
             last_move = game_state.board.peek()
-            for sq in [last_move.from_square, last_move.to_square]:
-                self._led_layer.colors[sq] = settings['led.color.previous_move']
+            previous_move_color: tuple[int, int, int] = settings['led.color.previous_move']
+            self._led_layer.colors.update(dict.fromkeys((last_move.from_square, last_move.to_square), previous_move_color))
 
     def _scan_board(self, board: chess.Board) -> chess.Move | None:
         """Scan the board for piece changes and determine if a legal move has been made.
@@ -85,6 +99,23 @@ class BoardState:
         """
         self._reset_led_layer()
 
+        board_white = self._board_white_bb
+        board_black = self._board_black_bb
+        game_white = board.occupied_co[chess.WHITE]
+        game_black = board.occupied_co[chess.BLACK]
+        changed_squares = (board_white ^ game_white) | (board_black ^ game_black)
+
+        if not changed_squares:
+            # Board matches the game, only the previous move is shown
+            self._led_layer.commit()
+            return None
+
+        # Read the colors once instead of per square
+        invalid_color: tuple[int, int, int] = settings['led.color.invalid_piece_placement']
+        move_to_color: tuple[int, int, int] = settings['led.color.move_to']
+        move_from_color: tuple[int, int, int] = settings['led.color.move_from']
+        capture_color: tuple[int, int, int] = settings['led.color.capture']
+
         log.debug("Scanning board for piece changes...")
 
         legal_move = None
@@ -96,23 +127,25 @@ class BoardState:
 
         color_map = self._led_layer.colors
 
-        for square in chess.SQUARES:
-            color_board = self._board_piece_color_map[square]
-            piece_game = board.piece_at(square)
+        # Only squares where the occupancy of either color differs need to be classified
+        for square in chess.scan_forward(changed_squares):
+            bb_square = chess.BB_SQUARES[square]
+            color_board = chess.WHITE if board_white & bb_square else chess.BLACK if board_black & bb_square else None
+            color_game = chess.WHITE if game_white & bb_square else chess.BLACK if game_black & bb_square else None
 
-            if color_board is None and piece_game is not None:
+            if color_board is None and color_game is not None:
                 # Piece removed
-                if piece_game.color == board.turn:
+                if color_game == board.turn:
                     missing_friendly_pieces.append(square)
                 else:
                     missing_opponent_pieces.append(square)
-            elif color_board is not None and piece_game is None:
+            elif color_board is not None and color_game is None:
                 # Piece added
                 if color_board == board.turn:
                     extra_friendly_pieces.append(square)
                 else:
                     extra_opponent_pieces.append(square)
-            elif color_board is not None and piece_game is not None and color_board != piece_game.color:
+            elif color_board is not None and color_game is not None and color_board != color_game:
                 # Piece changed
                 if color_board == board.turn:
                     extra_friendly_pieces.append(square)
@@ -122,94 +155,88 @@ class BoardState:
                     missing_friendly_pieces.append(square)
 
         if game_state.is_game_over:
-            color_map.update({sq: settings['led.color.invalid_piece_placement']
-                              for sq in missing_friendly_pieces + extra_friendly_pieces + missing_opponent_pieces + extra_opponent_pieces})
+            color_map.update(dict.fromkeys(missing_friendly_pieces + extra_friendly_pieces + missing_opponent_pieces + extra_opponent_pieces, invalid_color))
 
             self._led_layer.commit()
             return None
 
-        log.debug(f"Missing friendly pieces at {[chess.square_name(sq) for sq in missing_friendly_pieces]}")
-        log.debug(f"Missing opponent pieces at {[chess.square_name(sq) for sq in missing_opponent_pieces]}")
+        # Move generation is only needed when pieces are missing, generate the legal moves once for all checks below
+        legal_moves_all: list[chess.Move] = []
+        legal_moves_from: dict[int, list[chess.Move]] = collections.defaultdict(list)
+        legal_to_squares: set[int] = set()
+        if missing_friendly_pieces or missing_opponent_pieces:
+            legal_moves_all = list(board.legal_moves)
+            for move in legal_moves_all:
+                legal_moves_from[move.from_square].append(move)
+                legal_to_squares.add(move.to_square)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Missing friendly pieces at %s", [chess.square_name(sq) for sq in missing_friendly_pieces])
+            log.debug("Missing opponent pieces at %s", [chess.square_name(sq) for sq in missing_opponent_pieces])
 
-        log.debug(f"Extra friendly pieces at {[chess.square_name(sq) for sq in extra_friendly_pieces]}")
-        log.debug(f"Extra opponent pieces at {[chess.square_name(sq) for sq in extra_opponent_pieces]}")
+            log.debug("Extra friendly pieces at %s", [chess.square_name(sq) for sq in extra_friendly_pieces])
+            log.debug("Extra opponent pieces at %s", [chess.square_name(sq) for sq in extra_opponent_pieces])
 
         if len(extra_opponent_pieces) > 0 or len(missing_opponent_pieces) > 1:
-            color_map.update({sq: settings['led.color.invalid_piece_placement']
-                             for sq in extra_opponent_pieces + missing_opponent_pieces})
+            color_map.update(dict.fromkeys(extra_opponent_pieces + missing_opponent_pieces, invalid_color))
 
         if len(missing_opponent_pieces) == 1 and len(extra_opponent_pieces) == 0:
             # Check if the missing opponent piece can be captured by any friendly piece
             missing_sq = missing_opponent_pieces[0]
-            can_be_captured = False
-            for move in board.legal_moves:
-                can_be_captured = move.to_square == missing_sq
-                if can_be_captured:
-                    break
-
-            if can_be_captured:
-                color_map[missing_sq] = settings['led.color.capture']
-            else:
-                color_map[missing_sq] = settings['led.color.invalid_piece_placement']
+            color_map[missing_sq] = capture_color if missing_sq in legal_to_squares else invalid_color
 
         if board.has_castling_rights(board.turn) and len(missing_friendly_pieces) and len(extra_friendly_pieces) == 2:
             # Possible castling finished
-            castling_moves = []
-            for move in board.legal_moves:
-                if board.is_castling(move):
-                    from_sq = move.from_square
-                    to_sq = move.to_square
-                    if from_sq in missing_friendly_pieces and to_sq in extra_friendly_pieces:
-                        castling_moves.append(move)
+            # Only generate the legal castling moves of a lifted king instead of testing every legal move
+            missing_friendly_mask = chess.SquareSet(missing_friendly_pieces).mask
+            extra_friendly_set = set(extra_friendly_pieces)
+            castling_moves = [move for move in board.generate_castling_moves(from_mask=missing_friendly_mask)
+                              if move.to_square in extra_friendly_set]
 
             if len(castling_moves) == 1:
                 move = castling_moves[0]
                 legal_move = move
             else:
-                color_map.update({sq: settings['led.color.invalid_piece_placement']
-                                 for sq in missing_friendly_pieces + extra_friendly_pieces})
+                color_map.update(dict.fromkeys(missing_friendly_pieces + extra_friendly_pieces, invalid_color))
 
         elif len(missing_friendly_pieces) >= 2 or len(extra_friendly_pieces) >= 2:
-            color_map.update({sq: settings['led.color.invalid_piece_placement']
-                             for sq in missing_friendly_pieces + extra_friendly_pieces})
+            color_map.update(dict.fromkeys(missing_friendly_pieces + extra_friendly_pieces, invalid_color))
 
         if len(extra_friendly_pieces) > len(missing_friendly_pieces):
-            color_map.update({sq: settings['led.color.invalid_piece_placement']
-                             for sq in extra_friendly_pieces + missing_friendly_pieces})
+            color_map.update(dict.fromkeys(extra_friendly_pieces + missing_friendly_pieces, invalid_color))
 
         if len(missing_friendly_pieces) == 1 and len(extra_friendly_pieces) == 0:
             # Friendly piece lifted, mark legal moves
-            legal_moves = [move for move in board.legal_moves if move.from_square == missing_friendly_pieces[0]]
+            legal_moves = legal_moves_from.get(missing_friendly_pieces[0], [])
             if len(legal_moves) == 0:
-                color_map.update({sq: settings['led.color.invalid_piece_placement']
-                                 for sq in missing_friendly_pieces})
+                color_map.update(dict.fromkeys(missing_friendly_pieces, invalid_color))
 
             else:
                 destination_squares = [move.to_square for move in legal_moves]
+                capture_squares = [move.to_square for move in legal_moves if board.is_capture(move)]
 
-                color_map.update({sq: settings['led.color.move_to'] for sq in destination_squares})
-                color_map.update({sq: settings['led.color.move_from'] for sq in missing_friendly_pieces})
-
-                for move in legal_moves:
-                    if board.is_capture(move):
-                        color_map[move.to_square] = settings['led.color.capture']
+                color_map.update(dict.fromkeys(destination_squares, move_to_color))
+                color_map.update(dict.fromkeys(missing_friendly_pieces, move_from_color))
+                color_map.update(dict.fromkeys(capture_squares, capture_color))
 
         if len(missing_friendly_pieces) == 1 and len(extra_friendly_pieces) == 1:
-            for move in board.legal_moves:
-                if {move.from_square, move.to_square} == {missing_friendly_pieces[0], extra_friendly_pieces[0]}:
+            missing_sq = missing_friendly_pieces[0]
+            extra_sq = extra_friendly_pieces[0]
+            for move in legal_moves_all:
+                if (move.from_square == missing_sq and move.to_square == extra_sq) or \
+                        (move.from_square == extra_sq and move.to_square == missing_sq):
                     legal_move = move
                     break
             if legal_move is None:
-                color_map.update({sq: settings['led.color.invalid_piece_placement']
-                                 for sq in missing_friendly_pieces + extra_friendly_pieces})
+                color_map.update(dict.fromkeys(missing_friendly_pieces + extra_friendly_pieces, invalid_color))
 
         if legal_move is not None:
-            color_map.update({sq: settings['led.color.move_from'] for sq in missing_friendly_pieces})
+            color_map.update(dict.fromkeys(missing_friendly_pieces, move_from_color))
 
             if board.is_capture(legal_move):
-                color_map[legal_move.to_square] = settings['led.color.capture']
+                color_map[legal_move.to_square] = capture_color
             else:
-                color_map.update({sq: settings['led.color.move_to'] for sq in extra_friendly_pieces})
+                color_map.update(dict.fromkeys(extra_friendly_pieces, move_to_color))
 
         self._led_layer.commit()
 
@@ -5,6 +5,7 @@ import chessboard.events as events
 from chessboard.settings import settings, ColorSetting
 from chessboard.thread_safe_variable import ThreadSafeVariable
 from threading import Lock
+from typing import Iterable
 
 
 settings.register('led.color.white_square', ColorSetting((150, 150, 150)),
@@ -12,6 +13,12 @@ settings.register('led.color.white_square', ColorSetting((150, 150, 150)),
 settings.register('led.color.black_square', ColorSetting((0, 0, 0)),
                   "Base color for black squares on the chessboard LEDs")
 
+_NUM_SQUARES = len(chess.SQUARES)
+
+# Light and dark squares of the board, in ascending square order
+WHITE_SQUARES: tuple[int, ...] = tuple(chess.scan_forward(chess.BB_LIGHT_SQUARES))
+BLACK_SQUARES: tuple[int, ...] = tuple(chess.scan_forward(chess.BB_DARK_SQUARES))
+
 
 class LedLayer:
     def __init__(self, priority: int) -> None:
@@ -47,15 +54,47 @@ class LedLayer:
             self.square_opacity.clear()
             self.layer_opacity = 1.0
 
-    def commit(self) -> None:
-        """ Commit the current settings to be applied. """
+    def assign_colors(self, squares: Iterable[int], colors: Iterable[tuple[int, int, int]]) -> None:
+        """ Set the colors of many squares at once, colors are given in the same order as squares. """
+        with self._lock:
+            self.colors.update(zip(squares, colors))
+
+    def assign_square_opacity(self, squares: Iterable[int], opacities: Iterable[float]) -> None:
+        """ Set the opacity of many squares at once, opacities are given in the same order as squares. """
+        with self._lock:
+            self.square_opacity.update(zip(squares, opacities))
+
+    def commit(self, flush: bool = True) -> None:
+        """ Commit the current settings to be applied.
+
+        flush: Apply the layers right away, otherwise the change is published by the next led_manager.flush().
+        """
         with self._lock:
             self._commited_colors = self.colors.copy()
             self._commited_intensity = self.intensity.copy()
             self._commited_square_opacity = self.square_opacity.copy()
             self._commited_layer_opacity = self.layer_opacity
 
-        led_manager.apply_layers()
+        if flush:
+            led_manager.apply_layers()
+        else:
+            led_manager.mark_dirty()
+
+    def touched_squares(self) -> set[int]:
+        """ Squares this layer changes the color or intensity of. """
+        with self._lock:
+            return set(self.colors) | set(self.intensity)
+
+    def opaque_squares(self) -> set[int]:
+        """ Squares completely covered by the committed colors of this layer. """
+        with self._lock:
+            colors = self._commited_colors
+            square_opacity = self._commited_square_opacity
+            layer_opacity = self._commited_layer_opacity
+
+            if not square_opacity:
+                return set(colors) if layer_opacity >= 1.0 else set()
+            return {sq for sq in colors if square_opacity.get(sq, layer_opacity) >= 1.0}
 
     def apply_layer(self, board_colors: dict[int, tuple[int, int, int]]):
         """ Modify the layer colors with the provided colors. """
@@ -64,18 +103,29 @@ class LedLayer:
             colors = self._commited_colors
             intensity = self._commited_intensity
             square_opacity = self._commited_square_opacity
-            layer_opacity = self._commited_layer_opacity
+            layer_opacity = min(max(self._commited_layer_opacity, 0.0), 1.0)  # Clamp between 0.0 and 1.0
 
             for square, color in colors.items():
-                if square >= len(chess.SQUARES):
+                if square >= _NUM_SQUARES:
                     raise ValueError(f"Square {square} is out of bounds")
 
+                if square_opacity:
+                    opacity = square_opacity.get(square)
+                    opacity = layer_opacity if opacity is None else min(max(opacity, 0.0), 1.0)
+                else:
+                    opacity = layer_opacity
+
+                if opacity >= 1.0:
+                    # Fully opaque, no blending needed
+                    board_colors[square] = color
+                    continue
+                if opacity <= 0.0:
+                    # Fully transparent, keep the color below
+                    continue
+
                 r1, g1, b1 = board_colors[square]
                 r2, g2, b2 = color
 
-                opacity = square_opacity.get(square, layer_opacity)
-                opacity = min(max(opacity, 0.0), 1.0)  # Clamp between 0.0 and 1.0
-
                 r_final = int(r1 * (1 - opacity) + r2 * opacity)
                 g_final = int(g1 * (1 - opacity) + g2 * opacity)
                 b_final = int(b1 * (1 - opacity) + b2 * opacity)
@@ -83,9 +133,12 @@ class LedLayer:
                 board_colors[square] = (r_final, g_final, b_final)
 
             for square, intensity_value in intensity.items():
-                if square >= len(chess.SQUARES):
+                if square >= _NUM_SQUARES:
                     raise ValueError(f"Square {square} is out of bounds")
 
+                if intensity_value == 1.0:
+                    continue
+
                 r, g, b = board_colors[square]
 
                 r = int(max(0, min(255, r * intensity_value)))
@@ -99,17 +152,19 @@ class LedLayer:
 class _LedManager:
     def __init__(self) -> None:
         self.base_colors = {}
-        white_squares = [sq for sq in chess.SQUARES if (chess.square_rank(sq) + chess.square_file(sq)) % 2 == 1]
-        black_squares = [sq for sq in chess.SQUARES if (chess.square_rank(sq) + chess.square_file(sq)) % 2 == 0]
-
-        for square in white_squares:
+        for square in WHITE_SQUARES:
             self.base_colors[square] = settings['led.color.white_square']
-        for square in black_squares:
+        for square in BLACK_SQUARES:
             self.base_colors[square] = settings['led.color.black_square']
 
         # Track layers weakly so they auto-remove when destroyed
         self._layers: weakref.WeakSet[LedLayer] = weakref.WeakSet()
         self._lock = Lock()
+        self._dirty = False
+
+        # Colors of the last published frame, only squares differing from it are published
+        self._published_colors: dict[int, tuple[int, int, int]] | None = None
+        self._publish_lock = Lock()
 
         self.apply_layers()
 
@@ -126,8 +181,31 @@ class _LedManager:
         return final_colors
 
     def apply_layers(self) -> None:
-        """ Apply the LED layers and return the final colors for each square. """
-        events.event_manager.publish(events.SetSquareColorEvent(self.colors))
+        """ Apply the LED layers and publish the squares whose color changed since the last published frame. """
+        self._dirty = False
+
+        # Compose, diff and publish under the same lock so deltas are queued in the order they were computed
+        with self._publish_lock:
+            colors = self.colors
+            published = self._published_colors
+            if published is None:
+                color_map = colors
+            else:
+                color_map = {sq: color for sq, color in colors.items() if published[sq] != color}
+                if not color_map:
+                    return
+
+            self._published_colors = colors
+            events.event_manager.publish(events.SetSquareColorEvent(color_map))
+
+    def mark_dirty(self) -> None:
+        """ Mark the applied colors as outdated, they are published on the next flush(). """
+        self._dirty = True
+
+    def flush(self) -> None:
+        """ Apply the LED layers if any layer was committed without flushing since they were last applied. """
+        if self._dirty:
+            self.apply_layers()
 
     def add_layer(self, layer: LedLayer) -> None:
         with self._lock:
@@ -146,6 +224,22 @@ class _LedManager:
                 # WeakSet.discard does not raise if not present; keep silent
                 pass
 
+    def is_layer_visible(self, layer: LedLayer) -> bool:
+        """ Check if any square touched by the layer shows through the higher priority layers above it. """
+        squares = layer.touched_squares()
+        if not squares:
+            return True
+
+        with self._lock:
+            layers_above = [l for l in self._layers if l.priority > layer.priority]
+
+        for other in layers_above:
+            squares -= other.opaque_squares()
+            if not squares:
+                return False
+
+        return True
+
     def has_layer(self, layer: LedLayer) -> bool:
         with self._lock:
             return layer in self._layers
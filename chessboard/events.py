@@ -1,14 +1,15 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 import enum
+import logging
 from types import ModuleType
 import chess
 import chess.engine
 from chessboard.logger import log
 import threading
-import traceback
 import atexit
 import inspect
 import queue
+from typing import TypeVar
 
 
 @enum.unique
@@ -17,7 +18,24 @@ class PlayerType(enum.Enum):
     ENGINE = 'engine'
 
 
+# Event classes by name, filled in as subclasses of Event are defined
+_registry: dict[str, type['Event']] = {}
+
+
+def resolve(event_type: str) -> type['Event'] | None:
+    """ Get the event class with the given name, None if there is no such event. """
+    return _registry.get(event_type)
+
+
 class Event:
+    # Socket.IO topic the event is emitted on
+    _topic: str = 'board_event.Event'
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        _registry[cls.__name__] = cls
+        cls._topic = f'board_event.{cls.__name__}'
+
     def __init__(self):
         self.sender: ModuleType | None = None
         # Used for blocking publish
@@ -236,6 +254,9 @@ class GameStateChangedEvent(Event):
 
         self.last_move = board.move_stack[-1].uci() if board.move_stack else None
         self.is_check = board.is_check()
+        # Computed once here so subscribers don't each rescan the board
+        self.checkers: list[chess.Square] = list(board.checkers())
+        self.king_square = board.king(board.turn)
 
         self.clock_paused = clock_paused
         self.turn = self._parse_color(board.turn)
@@ -300,6 +321,33 @@ class HintEvent(Event):
         self.move = move
 
 
+_CallbackT = TypeVar('_CallbackT', bound=Callable)
+
+
+class SubscriptionTable:
+    """ Collects event callbacks so a module can register all of them with the event manager at once.
+
+    >>> subscriptions = SubscriptionTable()
+    >>> @subscriptions.on(HintEvent)
+    ... def handle_hint(event): pass
+    >>> [(event_type.__name__, callback.__name__) for event_type, callback in subscriptions]
+    [('HintEvent', 'handle_hint')]
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: list[tuple[type[Event], Callable]] = []
+
+    def on(self, event_type: type[Event]) -> Callable[[_CallbackT], _CallbackT]:
+        """ Decorator adding the decorated function as a callback for event_type. """
+        def decorator(callback: _CallbackT) -> _CallbackT:
+            self._subscriptions.append((event_type, callback))
+            return callback
+        return decorator
+
+    def __iter__(self) -> Iterator[tuple[type[Event], Callable]]:
+        return iter(self._subscriptions)
+
+
 class _EventManager:
     def __init__(self):
         self._subscribers: dict[type[Event],
@@ -323,6 +371,16 @@ class _EventManager:
 
         self._subscribers[event_type].append(callback)
 
+    def register_all(self, subscriptions: Iterable[tuple[type[Event], Callable]]):
+        """ Subscribe all (event type, callback) pairs, e.g. from a SubscriptionTable. """
+        subscriptions = list(subscriptions)
+        for event_type, _ in subscriptions:
+            if event_type not in self._subscribers:
+                raise ValueError(f"Unknown event type: {event_type}")
+
+        for event_type, callback in subscriptions:
+            self._subscribers[event_type].append(callback)
+
     def subscribe_all_events(self, callback: Callable[[Event], None]):
         for event_type in Event.__subclasses__():
             self._subscribers[event_type].append(callback)
@@ -362,8 +420,7 @@ class _EventManager:
             try:
                 callback(event)
             except Exception as e:
-                log.error(f"Error in event callback: {e}")
-                traceback.print_exc()
+                log.exception(f"Error in event callback: {e}")
         # Signal the event is handled if blocking was requested
         if event._sync_event is not None:
             event._sync_event.set()
@@ -374,7 +431,9 @@ class _EventManager:
             if event is None:
                 break
 
-            log.debug(f"{type(event).__name__}: {event.to_json()}")
+            # to_json() walks the whole event, skip it unless the message is actually logged
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("%s: %s", type(event).__name__, event.to_json())
 
             self._handle_event(event)
             self._event_queue.task_done()
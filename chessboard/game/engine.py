@@ -1,3 +1,4 @@
+import contextlib
 import os
 import time
 import chess
@@ -8,6 +9,7 @@ from threading import Thread, Event, current_thread
 from random import choice
 import chessboard.persistent_storage as persistent_storage
 import shutil
+import tempfile
 import requests
 import queue
 import math
@@ -15,6 +17,7 @@ import chessboard.events as events
 from chessboard.thread_safe_variable import ThreadSafeVariable
 
 import atexit
+from typing import IO
 
 settings.register("engine.player.time_limit", 20.0, "Time limit for engine analysis in seconds")
 
@@ -23,6 +26,9 @@ settings.register("engine.analysis.depth_limit", 25, "Depth limit for analysis")
 settings.register("engine.analysis.weight", "maia-1900.pb.gz", "Default engine weight file for analysis")
 
 
+# Chunk size when copying weight files, they are tens of megabytes
+_COPY_CHUNK_SIZE = 1024 * 1024
+
 DOWNLOADABLE_WEIGHTS = {
     "maia-1100.pb.gz": "https://github.com/CSSLab/maia-chess/releases/download/v1.0/maia-1100.pb.gz",
     "maia-1200.pb.gz": "https://github.com/CSSLab/maia-chess/releases/download/v1.0/maia-1200.pb.gz",
@@ -96,16 +102,25 @@ class _EngineStartAnalysisRequest:
                 f"board_fen={self.board.fen()})")
 
 
-def install_weight(weight_file: str) -> None:
-    """Install a new engine weight file from the given source path."""
-    dest_path = persistent_storage.get_filename(f'weights/{os.path.basename(weight_file)}')
-
-    if not os.path.isfile(weight_file):
-        raise FileNotFoundError(f"Source weight file not found: {weight_file}")
-
-    shutil.move(weight_file, dest_path)
-
-    log.info(f"Installed new engine weight from {weight_file} to {dest_path}")
+def install_weight_from_stream(stream: IO[bytes], weight_name: str) -> None:
+    """Install a new engine weight file by writing the given stream directly into the weights directory."""
+    dest_path = os.path.join(weight_directory(), os.path.basename(weight_name))
+    # Written to a unique file next to the destination and renamed when complete, so a partial upload never shows
+    # up as a weight and concurrent uploads of the same name don't write into the same file
+    fd, temp_path = tempfile.mkstemp(dir=weight_directory(), suffix='.tmp')
+
+    try:
+        # mkstemp creates the file readable by the owner only, weights are readable by everyone like other files
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            shutil.copyfileobj(stream, f, length=_COPY_CHUNK_SIZE)
+        os.replace(temp_path, dest_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+    log.info(f"Installed new engine weight {weight_name} to {dest_path}")
 
 
 def delete_weight(weight_name: str) -> None:
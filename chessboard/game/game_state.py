@@ -2,6 +2,7 @@ import chess
 import chess.engine
 
 import pickle
+import threading
 from chessboard.game.engine import engine
 from chessboard.game.chess_clock import ChessClock
 from chessboard.logger import log
@@ -16,6 +17,11 @@ class GameState:
     def __init__(self):
         self.board = chess.Board()
         self.chess_clock = ChessClock()
+        # FEN of the board, None when the board changed since it was last computed. The version is bumped on every
+        # change so a FEN computed from the board before the change is not stored
+        self._fen: str | None = None
+        self._fen_version = 0
+        self._fen_lock = threading.Lock()
 
         self._event_listeners_setup = False
         self._setup_event_listeners()
@@ -50,7 +56,7 @@ class GameState:
     def get_hint(self) -> chess.Move | None:
         """ Get a hint move from the engine for the current position """
         latest_analysis = self._latest_analysis.get()
-        if latest_analysis is None or latest_analysis.board.fen() != self.board.fen():
+        if latest_analysis is None or latest_analysis.board.fen() != self.fen():
             return None  # Analysis is for a different position
 
         best_move = latest_analysis.pv[0] if len(latest_analysis.pv) > 0 else None
@@ -60,6 +66,24 @@ class GameState:
 
         return best_move
 
+    def fen(self) -> str:
+        """ FEN of the current position, cached until the board changes through the game state. """
+        with self._fen_lock:
+            fen = self._fen
+            version = self._fen_version
+
+        if fen is None:
+            fen = self.board.fen()
+            with self._fen_lock:
+                if self._fen_version == version:
+                    self._fen = fen
+        return fen
+
+    def _invalidate_fen(self) -> None:
+        with self._fen_lock:
+            self._fen_version += 1
+            self._fen = None
+
     @property
     def engine_color(self) -> chess.Color | None:
         if self._players[chess.WHITE] == events.PlayerType.ENGINE:
@@ -132,6 +156,8 @@ class GameState:
         if self._players[self.board.turn] != events.PlayerType.HUMAN and len(self.board.move_stack) > 0:
             self.board.pop()
 
+        self._invalidate_fen()
+
         self.chess_clock.set_player(self.board.turn)
 
         self.publish_game_state()
@@ -181,7 +207,7 @@ class GameState:
 
         log.debug(
             f"Saved game state to {savefile}:\n"
-            f"  FEN: {self.board.fen()}\n"
+            f"  FEN: {self.fen()}\n"
             f"  White time left: {self.chess_clock.white_time_left}\n"
             f"  Black time left: {self.chess_clock.black_time_left}\n"
             f"  White player increment: {self.chess_clock.get_increment(chess.WHITE)}\n"
@@ -203,7 +229,7 @@ class GameState:
 
             log.info(
                 f"Loaded game state from {savefile}:\n"
-                f"  FEN: {loaded_game.board.fen()}\n"
+                f"  FEN: {loaded_game.fen()}\n"
                 f"  White time left: {loaded_game.chess_clock.white_time_left}\n"
                 f"  Black time left: {loaded_game.chess_clock.black_time_left}\n"
                 f"  White player increment: {loaded_game.chess_clock.get_increment(chess.WHITE)}\n"
@@ -299,6 +325,7 @@ class GameState:
         }
 
         self.board.reset()
+        self._invalidate_fen()
         self.chess_clock.reset()
 
     def publish_game_state(self):
@@ -365,6 +392,7 @@ class GameState:
 
     def _handle_move(self, event: events.ChessMoveEvent):
         self.board.push(event.move)
+        self._invalidate_fen()
 
         log.info(f"Move {event.move.uci()} registered")
 
@@ -434,6 +462,9 @@ class GameState:
         self.chess_clock.black_time_elapsed = black_time_elapsed
         self.chess_clock.current_player = self.board.turn
 
+        self._fen = None
+        self._fen_version = 0
+        self._fen_lock = threading.Lock()
         self._latest_analysis = ThreadSafeVariable(None)
 
         self._event_listeners_setup = False
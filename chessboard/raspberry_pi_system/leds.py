@@ -14,10 +14,14 @@ def _square_to_led_index(square: chess.Square) -> int:
     return file * 8 + rank
 
 
+# LED strip index of every square, the strip snakes up and down the files
+_LED_INDEX = tuple(_square_to_led_index(square) for square in chess.SQUARES)
+
+
 def _set_colors(strip: ws.PixelStrip, squares: list[chess.Square], color: tuple[int, int, int]):
+    led_color = ws.Color(*color)
     for square in squares:
-        led_index = _square_to_led_index(square)
-        strip.setPixelColor(led_index, ws.Color(*color))
+        strip.setPixelColor(_LED_INDEX[square], led_color)
 
 
 class _BoardLeds:
@@ -76,11 +80,12 @@ class _BoardLeds:
         if self._powering_off:
             return
 
+        strip = self._strip
         for square, color in event.color_map.items():
             if color is not None:
-                _set_colors(self._strip, [square], color)
+                strip.setPixelColor(_LED_INDEX[square], ws.Color(*color))
 
-        self._strip.show()
+        strip.show()
 
 
 board_leds = _BoardLeds()
@@ -53,6 +53,8 @@ class _Settings:
         self._settings: dict[str, _Setting] = {}
         self._settings_file: str = settings_file
         self._loaded_settings: dict[str, Any] = {}
+        # Incremented on every change so users can cache data derived from the settings
+        self._version = 0
         self._load()
 
     def __getitem__(self, key: str) -> Any:
@@ -61,9 +63,14 @@ class _Settings:
     def __setitem__(self, key: str, value: object):
         self.set(key, value)
 
+    @property
+    def version(self) -> int:
+        """ Number that changes whenever a setting is registered or changes value. """
+        return self._version
+
     @property
     def all_settings(self) -> dict[str, _Setting]:
-        log.debug(f"Retrieving all settings: {self._settings}")
+        log.debug("Retrieving all settings: %s", self._settings)
         return self._settings
 
     def get(self, key: str) -> _Setting:
@@ -77,6 +84,7 @@ class _Settings:
             raise KeyError(f"Setting '{key}' is already registered")
 
         self._settings[key] = _Setting(key, default, description)
+        self._version += 1
 
         if key in self._loaded_settings:
             self._settings[key].value = self._loaded_settings[key]
@@ -89,6 +97,7 @@ class _Settings:
             raise KeyError(f"Setting '{key}' not found")
 
         self._settings[key].value = value
+        self._version += 1
         log.info(f"Set setting '{key}' to '{value}'")
         self._save()
 
@@ -116,6 +125,7 @@ class _Settings:
     def restore_defaults(self):
         for _, setting in self._settings.items():
             setting.value = setting.default
+        self._version += 1
         log.info("Restored all settings to default values")
         self._save()
 